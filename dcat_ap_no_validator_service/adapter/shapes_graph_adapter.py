@@ -1,6 +1,6 @@
 """Module for fetching shapes graph descriptions."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from dcat_ap_no_validator_service.model import ShapesGraphDescription
 
@@ -59,6 +59,12 @@ _SHAPES_STORE: Dict[str, Dict] = dict(
     }
 )
 
+# the store is static, so the description objects are created once on import:
+_SHAPES_CACHE: Dict[str, ShapesGraphDescription] = {
+    id: ShapesGraphDescription(**x) for id, x in _SHAPES_STORE.items()
+}
+_SHAPES_TUPLE: Tuple[ShapesGraphDescription, ...] = tuple(_SHAPES_CACHE.values())
+
 
 class ShapesGraphAdapter:
     """Class representing a shapes graph adapter.
@@ -69,13 +75,11 @@ class ShapesGraphAdapter:
     """
 
     @classmethod
-    async def get_all(cls: Any) -> List[ShapesGraphDescription]:
+    async def get_all(cls: Any) -> Tuple[ShapesGraphDescription, ...]:
         """List all shapes graph objects in store."""
-        return [ShapesGraphDescription(**x) for x in _SHAPES_STORE.values()]
+        return _SHAPES_TUPLE
 
     @classmethod
     async def get_by_id(cls: Any, id: str) -> Optional[ShapesGraphDescription]:
         """Get shapes graph given by id if in objects in store."""
-        if id in _SHAPES_STORE:
-            return ShapesGraphDescription(**_SHAPES_STORE[id])
-        return None
+        return _SHAPES_CACHE.get(id)
@@ -1,12 +1,32 @@
 """Nox sessions."""
 
+import hashlib
+from pathlib import Path
 import sys
 
 import nox
 from nox_poetry import Session, session
 
 locations = "dcat_ap_no_validator_service", "tests", "noxfile.py"
+pip_cache_dir = ".cache/pip"
+test_deps = (
+    "pytest",
+    "pytest-mock",
+    "pytest-aiohttp",
+    "pytest-profiling",
+    "aioresponses",
+)
+contract_test_deps = (
+    "pytest",
+    "pytest-docker",
+    "pytest_mock",
+    "pytest-asyncio",
+    "pytest-xdist",
+    "filelock",
+    "aioresponses",
+)
 nox.options.stop_on_first_error = True
+nox.options.reuse_existing_virtualenvs = True
 nox.options.sessions = (
     "lint",
     "mypy",
@@ -20,19 +40,13 @@ nox.options.sessions = (
 def unit_tests(session: Session) -> None:
     """Run the unit test suite."""
     args = session.posargs
-    session.install(".")
-    session.install(
-        "requests",
-        "pytest",
-        "pytest-mock",
-        "pytest-aiohttp",
-        "pytest-profiling",
-        "aioresponses",
-    )
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
+    session.install(".", *test_deps)
     session.run(
         "pytest",
         "-m unit",
         "-rfE",
+        "tests/unit",
         *args,
         env={"CONFIG": "test"},
     )
@@ -42,21 +56,13 @@ def unit_tests(session: Session) -> None:
 def integration_tests(session: Session) -> None:
     """Run the integration test suite."""
     args = session.posargs or ["--cov"]
-    session.install(".")
-    session.install(
-        "coverage[toml]",
-        "requests",
-        "pytest",
-        "pytest-cov",
-        "pytest-mock",
-        "pytest-aiohttp",
-        "pytest-profiling",
-        "aioresponses",
-    )
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
+    session.install(".", "coverage[toml]", "pytest-cov", *test_deps)
     session.run(
         "pytest",
         "-m integration",
         "-rfE",
+        "tests/integration",
         *args,
         env={"CONFIG": "test"},
     )
@@ -66,18 +72,14 @@ def integration_tests(session: Session) -> None:
 def contract_tests(session: Session) -> None:
     """Run the contract test suite."""
     args = session.posargs
-    session.install(".")
-    session.install(
-        "requests",
-        "pytest",
-        "pytest-docker",
-        "pytest_mock",
-        "pytest-asyncio",
-        "aioresponses",
-    )
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
+    session.install(".", *contract_test_deps)
     session.run(
         "pytest",
         "-m contract",
+        "-n",
+        "auto",
+        "--dist=loadfile",
         "-rfE",
         *args,
         env={
@@ -94,6 +96,7 @@ def contract_tests(session: Session) -> None:
 def black(session: Session) -> None:
     """Run black code formatter."""
     args = session.posargs or locations
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
     session.install("black")
     session.run("black", *args)
 
@@ -102,6 +105,7 @@ def black(session: Session) -> None:
 def lint(session: Session) -> None:
     """Lint using flake8."""
     args = session.posargs or locations
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
     session.install(
         "flake8",
         "flake8-annotations",
@@ -118,15 +122,22 @@ def lint(session: Session) -> None:
 @session(python=["3.10"])
 def mypy(session: Session) -> None:
     """Type-check using mypy."""
-    args = session.posargs or [
-        "--install-types",
-        "--non-interactive",
-        "dcat_ap_no_validator_service",
-        "tests",
-    ]
-    session.install(".")
-    session.install("mypy", "pytest")
-    session.run("mypy", *args)
+    args = session.posargs or ["dcat_ap_no_validator_service", "tests"]
+    # stub packages only need to be (re)installed when the dependencies change:
+    types_installed = Path(session.virtualenv.location, ".types-installed")
+    deps_hash = hashlib.sha256(
+        Path("poetry.lock").read_bytes() + Path("pyproject.toml").read_bytes()
+    ).hexdigest()
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
+    session.install(".", "mypy", "pytest")
+    if session.posargs or (
+        types_installed.is_file() and types_installed.read_text() == deps_hash
+    ):
+        session.run("mypy", *args)
+    else:
+        # session.run returns None when skipped, e.g. under --install-only:
+        if session.run("mypy", "--install-types", "--non-interactive", *args):
+            types_installed.write_text(deps_hash)
     if not session.posargs:
         session.run("mypy", f"--python-executable={sys.executable}", "noxfile.py")
 
@@ -134,5 +145,6 @@ def mypy(session: Session) -> None:
 @session(python=["3.10"])
 def coverage(session: Session) -> None:
     """Upload coverage data."""
+    session.env["PIP_CACHE_DIR"] = pip_cache_dir
     session.install("coverage[toml]")
     session.run("coverage", "xml", "--fail-under=0")
@@ -0,0 +1,115 @@
+"""Conftest module for contract tests."""
+
+import os
+from os import environ as env
+import time
+from typing import Any, AsyncIterator, Iterator
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from aiohttp import ClientSession
+from filelock import FileLock
+import pytest
+import pytest_asyncio
+from pytest_docker.plugin import DockerComposeExecutor, Services, str_to_list
+
+HOST_PORT = int(env.get("HOST_PORT", "8080"))
+
+
+def is_responsive(url: Any) -> Any:
+    """Return true if response from service is 200."""
+    url = f"{url}/ready"
+    try:
+        with urlopen(url, timeout=10000) as response:  # noqa: S310
+            if response.status == 200:
+                time.sleep(2)  # sleep extra 2 sec
+                return True
+    except (ConnectionError, URLError):
+        return False
+
+
+@pytest.mark.contract
+@pytest.fixture(scope="session")
+def http_service(docker_ip: Any, docker_services: Any) -> Any:
+    """Ensure that HTTP service is up and responsive."""
+    # `port_for` takes a container port and returns the corresponding host port
+    port = docker_services.port_for("dcat-ap-no-validator-service", HOST_PORT)
+    url = "http://{}:{}".format(docker_ip, port)
+    docker_services.wait_until_responsive(
+        timeout=30.0, pause=0.1, check=lambda: is_responsive(url)
+    )
+    return url
+
+
+@pytest.mark.contract
+@pytest_asyncio.fixture(scope="session")
+async def http_client() -> AsyncIterator[ClientSession]:
+    """Share one client session, and thereby its connection pool, between tests."""
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest.mark.contract
+@pytest.fixture(scope="session")
+def docker_compose_file(pytestconfig: Any) -> Any:
+    """Override default location of docker-compose.yml file."""
+    return os.path.join(str(pytestconfig.rootdir), "./", "docker-compose.yml")
+
+
+@pytest.mark.contract
+@pytest.fixture(scope="session")
+def docker_compose_project_name() -> str:
+    """Override project name: all xdist workers must share the same containers."""
+    return "pytest{}".format(env.get("PYTEST_XDIST_TESTRUNUID", os.getpid()))
+
+
+@pytest.mark.contract
+@pytest.fixture(scope="session")
+def docker_cleanup(pytestconfig: Any) -> Any:
+    """Override cleanup: do not remove containers in order to inspect logs."""
+    return "stop"
+
+
+@pytest.mark.contract
+@pytest.fixture(scope="session")
+def docker_services(
+    docker_compose_command: str,
+    docker_compose_file: Any,
+    docker_compose_project_name: str,
+    docker_setup: Any,
+    docker_cleanup: Any,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[Services]:
+    """Override docker_services: start and stop containers once across workers.
+
+    When running under pytest-xdist every worker gets its own session, so the
+    workers are reference counted behind a file lock: the first worker in runs
+    the setup commands and the last worker out runs the cleanup commands.
+    Otherwise mirrors `get_docker_services` as of pytest-docker 3.1.1.
+    """
+    docker_compose = DockerComposeExecutor(
+        docker_compose_command, docker_compose_file, docker_compose_project_name
+    )
+    # the parent of a worker's basetemp is shared by all workers in a test run
+    root_tmp_dir = tmp_path_factory.getbasetemp()
+    if env.get("PYTEST_XDIST_WORKER"):
+        root_tmp_dir = root_tmp_dir.parent
+    lock = FileLock(str(root_tmp_dir / "docker_services.lock"))
+    counter = root_tmp_dir / "docker_services.count"
+
+    with lock:
+        workers = int(counter.read_text()) if counter.is_file() else 0
+        if workers == 0 and docker_setup:
+            for command in str_to_list(docker_setup):
+                docker_compose.execute(command)
+        counter.write_text(str(workers + 1))
+
+    try:
+        yield Services(docker_compose)
+    finally:
+        with lock:
+            workers = int(counter.read_text()) - 1
+            if workers == 0 and docker_cleanup:
+                for command in str_to_list(docker_cleanup):
+                    docker_compose.execute(command)
+            counter.write_text(str(workers))
@@ -11,15 +11,15 @@ from rdflib.compare import graph_diff  # , isomorphic
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_get_all_ontologies(http_service: Any) -> None:
+@pytest.mark.asyncio(scope="session")
+async def test_get_all_ontologies(
+    http_service: Any, http_client: ClientSession
+) -> None:
     """Should return 200 and a list of ontologies."""
     url = f"{http_service}/ontologies"
 
-    session = ClientSession()
-    async with session.get(url) as resp:
+    async with http_client.get(url) as resp:
         body = await resp.json()
-    await session.close()
 
     assert resp.status == 200
     assert "application/json" in resp.headers[hdrs.CONTENT_TYPE]
@@ -44,16 +44,16 @@ async def test_get_all_ontologies(http_service: Any) -> None:
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_get_ontology_by_id(http_service: Any) -> None:
+@pytest.mark.asyncio(scope="session")
+async def test_get_ontology_by_id(
+    http_service: Any, http_client: ClientSession
+) -> None:
     """Should return 200 and a ontology description."""
     ontology_id = 1
     url = f"{http_service}/ontologies/{ontology_id}"
 
-    session = ClientSession()
-    async with session.get(url) as resp:
+    async with http_client.get(url) as resp:
         ontology = await resp.json()
-    await session.close()
 
     assert resp.status == 200
     assert "application/json" in resp.headers[hdrs.CONTENT_TYPE]
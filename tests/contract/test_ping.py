@@ -7,15 +7,13 @@ import pytest
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_ping(http_service: Any) -> None:
+@pytest.mark.asyncio(scope="session")
+async def test_ping(http_service: Any, http_client: ClientSession) -> None:
     """Should return OK."""
     url = f"{http_service}/ping"
 
-    session = ClientSession()
-    async with session.get(url) as response:
+    async with http_client.get(url) as response:
         text = await response.text()
-    await session.close()
 
     assert response.status == 200
     assert text == "OK"
@@ -9,15 +9,13 @@ import pytest
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_get_all_shapes(http_service: Any) -> None:
+@pytest.mark.asyncio(scope="session")
+async def test_get_all_shapes(http_service: Any, http_client: ClientSession) -> None:
     """Should return 200 and a list of shapes."""
     url = f"{http_service}/shapes"
 
-    session = ClientSession()
-    async with session.get(url) as resp:
+    async with http_client.get(url) as resp:
         body = await resp.json()
-    await session.close()
 
     assert resp.status == 200
     assert "application/json" in resp.headers[hdrs.CONTENT_TYPE]
@@ -42,16 +40,14 @@ async def test_get_all_shapes(http_service: Any) -> None:
 
 
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_get_shape_by_id(http_service: Any) -> None:
+@pytest.mark.asyncio(scope="session")
+async def test_get_shape_by_id(http_service: Any, http_client: ClientSession) -> None:
     """Should return 200 and a shape description."""
     shape_id = 1
     url = f"{http_service}/shapes/{shape_id}"
 
-    session = ClientSession()
-    async with session.get(url) as resp:
+    async with http_client.get(url) as resp:
         shape = await resp.json()
-    await session.close()
 
     assert resp.status == 200
     assert "application/json" in resp.headers[hdrs.CONTENT_TYPE]
@@ -1,5 +1,6 @@
 """Contract test cases for ready."""
 
+from contextlib import ExitStack
 from typing import Any
 
 from aiohttp import ClientSession, hdrs, MultipartWriter
@@ -12,32 +13,33 @@ from rdflib.compare import graph_diff, isomorphic
     reason="Currently not working due to https://github.com/Informasjonsforvaltning/organization-catalog/issues/124."
 )
 @pytest.mark.contract
-@pytest.mark.asyncio
-async def test_validator_with_skos_ap_no(http_service: Any) -> None:
+@pytest.mark.asyncio(scope="session")
+async def test_validator_with_skos_ap_no(
+    http_service: Any, http_client: ClientSession
+) -> None:
     """Should return OK and successful validation."""
     url = f"{http_service}/validator"
     data_graph_file = "tests/files/valid_collection.ttl"
     shapes_graph_file = "tests/files/mock_skos-ap-no-shacl_shapes.ttl"
     ontology_graph_file = "tests/files/skos_ontologies.ttl"
 
-    with MultipartWriter("mixed") as mpwriter:
-        p = mpwriter.append(open(data_graph_file, "rb"))
-        p.set_content_disposition(
-            "attachment", name="data-graph-file", filename=data_graph_file
-        )
-        p = mpwriter.append(open(shapes_graph_file, "rb"))
-        p.set_content_disposition(
-            "attachment", name="shapes-graph-file", filename=shapes_graph_file
-        )
-        p = mpwriter.append(open(ontology_graph_file, "rb"))
-        p.set_content_disposition(
-            "attachment", name="ontology-graph-file", filename=ontology_graph_file
-        )
-
-    session = ClientSession()
-    async with session.post(url, data=mpwriter) as resp:
-        body = await resp.text()
-    await session.close()
+    with ExitStack() as stack:
+        with MultipartWriter("mixed") as mpwriter:
+            p = mpwriter.append(stack.enter_context(open(data_graph_file, "rb")))
+            p.set_content_disposition(
+                "attachment", name="data-graph-file", filename=data_graph_file
+            )
+            p = mpwriter.append(stack.enter_context(open(shapes_graph_file, "rb")))
+            p.set_content_disposition(
+                "attachment", name="shapes-graph-file", filename=shapes_graph_file
+            )
+            p = mpwriter.append(stack.enter_context(open(ontology_graph_file, "rb")))
+            p.set_content_disposition(
+                "attachment", name="ontology-graph-file", filename=ontology_graph_file
+            )
+
+        async with http_client.post(url, data=mpwriter) as resp:
+            body = await resp.text()
 
     assert resp.status == 200
     assert "text/turtle" in resp.headers[hdrs.CONTENT_TYPE]
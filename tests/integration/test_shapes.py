@@ -7,6 +7,7 @@ from aiohttp.test_utils import TestClient as _TestClient
 import pytest
 from pytest_mock import MockFixture
 
+from dcat_ap_no_validator_service.model import ShapesGraphDescription
 
 _MOCK_SHAPES_STORE: Dict[str, Dict] = dict(
     {
@@ -24,14 +25,17 @@ _MOCK_SHAPES_STORE: Dict[str, Dict] = dict(
         },
     }
 )
+_MOCK_SHAPES_CACHE: Dict[str, ShapesGraphDescription] = {
+    id: ShapesGraphDescription(**x) for id, x in _MOCK_SHAPES_STORE.items()
+}
 
 
 @pytest.mark.integration
 async def test_get_all_shapes(client: _TestClient, mocker: MockFixture) -> None:
     """Should return OK."""
     mocker.patch(
-        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_STORE",
-        _MOCK_SHAPES_STORE,
+        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_TUPLE",
+        tuple(_MOCK_SHAPES_CACHE.values()),
     )
 
     resp = await client.get("/shapes")
@@ -45,8 +49,8 @@ async def test_get_all_shapes(client: _TestClient, mocker: MockFixture) -> None:
 async def test_get_shapes_by_id(client: _TestClient, mocker: MockFixture) -> None:
     """Should return OK."""
     mocker.patch(
-        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_STORE",
-        _MOCK_SHAPES_STORE,
+        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_CACHE",
+        _MOCK_SHAPES_CACHE,
     )
 
     resp = await client.get("/shapes/1")
@@ -24,17 +24,20 @@ _MOCK_SHAPES_STORE: Dict[str, Dict] = dict(
         },
     }
 )
+_MOCK_SHAPES_CACHE: Dict[str, ShapesGraphDescription] = {
+    id: ShapesGraphDescription(**x) for id, x in _MOCK_SHAPES_STORE.items()
+}
 
 
 @pytest.mark.unit
 async def test_get_all(mocker: MockFixture) -> None:
     """Should return a non-empty graph collection."""
     mocker.patch(
-        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_STORE",
-        _MOCK_SHAPES_STORE,
+        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_TUPLE",
+        tuple(_MOCK_SHAPES_CACHE.values()),
     )
     shapes_collection = await ShapesGraphAdapter.get_all()
-    assert isinstance(shapes_collection, list)
+    assert isinstance(shapes_collection, tuple)
     assert len(shapes_collection) == 2
     for s in shapes_collection:
         assert isinstance(s, ShapesGraphDescription)
@@ -45,14 +48,25 @@ async def test_get_all(mocker: MockFixture) -> None:
 async def test_get_by_id(mocker: MockFixture) -> None:
     """Should return a non-empty graph."""
     mocker.patch(
-        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_STORE",
-        _MOCK_SHAPES_STORE,
+        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_CACHE",
+        _MOCK_SHAPES_CACHE,
     )
     shapes = await ShapesGraphAdapter.get_by_id("1")
     assert isinstance(shapes, ShapesGraphDescription)
     assert identical_content(shapes, _MOCK_SHAPES_STORE["1"])
 
 
+@pytest.mark.unit
+async def test_get_by_id_not_found(mocker: MockFixture) -> None:
+    """Should return None."""
+    mocker.patch(
+        "dcat_ap_no_validator_service.adapter.shapes_graph_adapter._SHAPES_CACHE",
+        _MOCK_SHAPES_CACHE,
+    )
+    shapes = await ShapesGraphAdapter.get_by_id("3")
+    assert shapes is None
+
+
 def identical_content(s: Any, d: dict) -> bool:
     """Check for equal content."""
     return (